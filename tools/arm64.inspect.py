@@ -18,11 +18,14 @@ import os
 import subprocess
 import re
 import argparse
+import concurrent.futures
+import gzip
+import pickle
 import shutil
 import glob
 import traceback
 from pathlib import Path
-from collections import OrderedDict
+from collections import Counter, deque
 
 
 # ARM64 SIMD extensions to check
@@ -82,6 +85,196 @@ INSPECT_ARRAY = {
     "evtstrm": r"\sevtstrm",
 }
 
+# Optional in-process ELF parser: one pyelftools pass over the binary
+# replaces the file/nm/strings/readelf subprocess fan-out (four fork+execs
+# and four full re-reads of the binary); without pyelftools the subprocess
+# helpers below are used as before.
+try:
+    from elftools.elf.elffile import ELFFile
+except ImportError:
+    ELFFile = None
+
+# ELF e_machine values mapped to the arch names file(1) reports
+ELF_MACHINE_NAMES = {
+    "EM_AARCH64": "ARM aarch64",
+    "EM_X86_64": "x86-64",
+    "EM_386": "i386",
+    "EM_MIPS": "MIPS",
+}
+
+# parse_file_info() capture regexes, precompiled once at module load;
+# the plain-literal checks in that method use `in` directly
+_BINARY_FORMAT_RE = re.compile(r"(ELF [^,]+)")
+_ARCH_RE = re.compile(r"(ARM aarch64|x86-64|i386|MIPS)")
+_ELF_VERSION_RE = re.compile(r"(version \d+ \([^)]+\))")
+_INTERPRETER_RE = re.compile(r"interpreter ([^,]+)")
+_ANDROID_API_RE = re.compile(r"for (Android \d+)")
+_BUILDER_RE = re.compile(r"built by (NDK [^,]+)")
+_BUILDID_RE = re.compile(r"BuildID\[sha1\]=([0-9a-f]+)")
+
+# Instruction lines in llvm-objdump output start with an indented hex address
+ADDR_RE = re.compile(r"^\s+[0-9a-f]+:")
+
+# All INSPECT_ARRAY patterns combined into a single alternation, used as
+# a cheap prefilter: most instruction lines hit no pattern at all and are
+# rejected with one scan. Lines that do hit are re-checked against the
+# per-extension compiled patterns below, because alternation matches are
+# non-overlapping and would shadow extensions that share a mnemonic
+# (e.g. sha2/sha512, asimdrdm/sve2).
+COMBINED_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in INSPECT_ARRAY.items())
+)
+
+# Per-extension compiled patterns, searched independently on prefiltered
+# lines so every extension that hits a line is counted
+INSPECT_COMPILED = {
+    name: re.compile(pattern) for name, pattern in INSPECT_ARRAY.items()
+}
+
+# Optional Aho-Corasick accelerator: most INSPECT_ARRAY alternatives are
+# fixed mnemonics, which pyahocorasick matches against all patterns in a
+# single DFA traversal per line instead of one backtracking regex each.
+# Regex-shaped alternatives (character classes, \s+ operands) stay on a
+# small set of compiled residual regexes; without pyahocorasick the
+# prefilter plus per-extension regexes above handle the scan.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_LITERAL_RE = re.compile(r"[a-z0-9]+")
+
+
+def _build_automaton():
+    """Build the literal-mnemonic automaton and residual regexes
+
+    Splits every INSPECT_ARRAY alternation into plain-literal mnemonics
+    (fed to the automaton, each mapped to its extension names) and
+    regex-shaped leftovers (recompiled per extension). Returns
+    (None, None) when pyahocorasick is unavailable.
+    """
+    if ahocorasick is None:
+        return None, None
+    literal_exts = {}
+    residuals = {}
+    for ext_name, pattern in INSPECT_ARRAY.items():
+        body = pattern[len(r"\s"):]
+        if body.startswith("(") and body.endswith(")"):
+            body = body[1:-1]
+        residual = []
+        for alt in body.split("|"):
+            if _LITERAL_RE.fullmatch(alt):
+                literal_exts.setdefault(alt, []).append(ext_name)
+            else:
+                residual.append(alt)
+        if residual:
+            residuals[ext_name] = re.compile(r"\s(" + "|".join(residual) + ")")
+    automaton = ahocorasick.Automaton()
+    for word, exts in literal_exts.items():
+        automaton.add_word(word, (len(word), tuple(exts)))
+    automaton.make_automaton()
+    return automaton, residuals
+
+
+AC_AUTOMATON, RESIDUAL_RE = _build_automaton()
+
+
+def match_extensions(line):
+    """Return the set of extension names whose pattern hits this line"""
+    if AC_AUTOMATON is None:
+        if COMBINED_RE.search(line) is None:
+            return set()
+        return {
+            ext_name
+            for ext_name, pattern in INSPECT_COMPILED.items()
+            if pattern.search(line)
+        }
+    groups = set()
+    for end, (word_len, exts) in AC_AUTOMATON.iter(line):
+        # INSPECT_ARRAY patterns require whitespace (\s) before the
+        # mnemonic; enforce the same boundary on automaton hits
+        start = end - word_len + 1
+        if start > 0 and line[start - 1] in " \t":
+            groups.update(exts)
+    for ext_name, pattern in RESIDUAL_RE.items():
+        if ext_name not in groups and pattern.search(line):
+            groups.add(ext_name)
+    return groups
+
+
+# Persistent result cache: inspect() output keyed by the binary's size,
+# mtime and inode, so re-running on an unchanged binary skips objdump
+# (by far the dominant cost) entirely
+CACHE_DIR = Path("~/.cache/arm64-inspect").expanduser()
+
+# llvm-objdump output-trimming flags, applied when the local objdump
+# supports them (probed once via --help): dropping the raw instruction
+# bytes, the leading address and any disassembler color escapes shrinks
+# every line the scanner has to traverse and makes instruction lines
+# detectable without a regex. Each entry is (help-probe token, argv
+# flag), since --disassembler-color takes a value. Operand
+# symbolization is already off by default, so there is nothing to
+# disable there.
+OBJDUMP_TRIM_FLAGS = (
+    ("--no-show-raw-insn", "--no-show-raw-insn"),
+    ("--no-leading-addr", "--no-leading-addr"),
+    ("--disassembler-color", "--disassembler-color=off"),
+)
+
+# Maximum number of sample instructions to keep per extension
+SAMPLE_LIMIT = 5
+
+# Size of the newline-aligned disassembly chunks handed to scan workers
+SCAN_CHUNK_SIZE = 4 << 20
+
+# Binaries below this size are scanned in-process; the worker-pool setup
+# cost is not worth it for small disassemblies
+PARALLEL_MIN_SIZE = 8 << 20
+
+
+def scan_disasm_lines(lines, sample_limit=SAMPLE_LIMIT, bare=False):
+    """Scan disassembly lines in a single pass.
+
+    Returns (total_insn, per-extension hit Counter, per-extension sample
+    instruction lists). Consumes the line iterable exactly once, so it can
+    be fed directly from a subprocess pipe without buffering the whole
+    disassembly. With bare=True the lines carry no address prefix
+    (--no-leading-addr) and instruction lines are detected by their
+    indentation and mnemonic tab instead of the address regex.
+    """
+    total_insn = 0
+    counts = Counter()
+    samples = {}
+    for line in lines:
+        if bare:
+            if not (line.startswith((" ", "\t")) and "\t" in line):
+                continue
+        elif not ADDR_RE.match(line):
+            continue
+        total_insn += 1
+        for group in match_extensions(line):
+            counts[group] += 1
+            sample = samples.setdefault(group, deque(maxlen=sample_limit))
+            if len(sample) < sample_limit:
+                sample.append(line.strip())
+    return total_insn, counts, samples
+
+
+def scan_disasm_chunk(chunk, sample_limit=SAMPLE_LIMIT, bare=False):
+    """Scan one newline-aligned chunk of disassembly (worker entry point)"""
+    return scan_disasm_lines(chunk.splitlines(), sample_limit, bare)
+
+
+def merge_samples(samples, part_samples, sample_limit=SAMPLE_LIMIT):
+    """Merge per-extension samples from a worker, keeping at most
+    sample_limit per extension"""
+    for group, part in part_samples.items():
+        sample = samples.setdefault(group, deque(maxlen=sample_limit))
+        for line in part:
+            if len(sample) >= sample_limit:
+                break
+            sample.append(line)
+
 
 def find_llvm_objdump(user_path=None):
     """Find llvm-objdump in PATH or use user-specified path"""
@@ -97,6 +290,17 @@ def find_llvm_objdump(user_path=None):
     if objdump_in_path:
         return Path(objdump_in_path)
 
+    # Reuse a previously resolved NDK path before re-globbing the NDK
+    # trees, which costs tens of ms per run when scripting over many
+    # binaries
+    path_cache = CACHE_DIR / "objdump-path"
+    try:
+        cached = Path(path_cache.read_text().strip())
+        if cached.exists():
+            return cached
+    except OSError:
+        pass
+
     # Try common Android NDK locations
     ndk_paths = [
         "/opt/android_sdk/ndk/*/toolchains/llvm/prebuilt/linux-x86_64/bin/llvm-objdump",
@@ -113,7 +317,13 @@ def find_llvm_objdump(user_path=None):
         if matches:
             # Return the first (likely newest) match
             matches.sort(reverse=True)
-            return Path(matches[0])
+            resolved = Path(matches[0]).resolve()
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                path_cache.write_text(f"{resolved}\n")
+            except OSError:
+                pass
+            return resolved
 
     raise FileNotFoundError(
         "llvm-objdump not found in PATH or common NDK locations. "
@@ -130,6 +340,120 @@ class BinaryInspector:
             raise FileNotFoundError(f"Binary not found: {binary_path}")
 
         self.llvm_objdump = llvm_objdump_path
+        # Per-extension sample instructions, filled in by inspect()
+        self.samples = {}
+        # Supported output-trimming flags, probed lazily
+        self._extra_flags = None
+        # Cached readelf -hn output for the subprocess fallback path
+        self._readelf_hn = None
+
+    def get_elf_info(self):
+        """Parse binary metadata in a single in-process pyelftools pass
+
+        Returns the same dict as parse_file_info(), or None when
+        pyelftools is unavailable or the file is not a parseable ELF
+        (callers then fall back to the subprocess path).
+        """
+        if ELFFile is None:
+            return None
+        try:
+            with open(self.binary_path, "rb") as f:
+                return self._parse_elf(ELFFile(f))
+        except Exception:
+            return None
+
+    def _parse_elf(self, elf):
+        """Extract the parse_file_info() fields from an open ELFFile"""
+        header = elf.header
+        e_ident = header["e_ident"]
+        elf_class = "64-bit" if e_ident["EI_CLASS"] == "ELFCLASS64" else "32-bit"
+        endianness = "LSB" if e_ident["EI_DATA"] == "ELFDATA2LSB" else "MSB"
+
+        # Interpreter and dynamic linking come from the program headers
+        interpreter = "none"
+        dynamically_linked = False
+        for segment in elf.iter_segments():
+            if segment["p_type"] == "PT_INTERP":
+                interpreter = segment.get_interp_name()
+            elif segment["p_type"] == "PT_DYNAMIC":
+                dynamically_linked = True
+
+        # file(1) reports ET_DYN with an interpreter as a pie executable
+        if header["e_type"] == "ET_EXEC":
+            elf_type = "executable"
+        elif header["e_type"] == "ET_DYN":
+            elf_type = (
+                "pie executable" if interpreter != "none" else "shared object"
+            )
+        elif header["e_type"] == "ET_REL":
+            elf_type = "relocatable"
+        else:
+            elf_type = str(header["e_type"])
+        binary_format = f"ELF {elf_class} {endianness} {elf_type}"
+
+        arch = ELF_MACHINE_NAMES.get(header["e_machine"], "unknown")
+
+        if header["e_version"] == "EV_CURRENT":
+            os_abi = (
+                "GNU/Linux"
+                if e_ident["EI_OSABI"] == "ELFOSABI_LINUX"
+                else "SYSV"
+            )
+            elf_version = f"version 1 ({os_abi})"
+        else:
+            elf_version = "unknown"
+
+        # BuildID and the Android API/NDK builder live in note sections
+        build_id_sha1 = "none"
+        android_api = "none"
+        builder = "unknown"
+        for section in elf.iter_sections():
+            if not section.name.startswith(".note"):
+                continue
+            for note in section.iter_notes():
+                if note["n_type"] == "NT_GNU_BUILD_ID":
+                    build_id_sha1 = note["n_desc"]
+                elif section.name == ".note.android.ident":
+                    android_api, builder = self._parse_android_ident(note)
+
+        return {
+            "binary_format": binary_format,
+            "arch": arch,
+            "elf_version": elf_version,
+            "dynamically_linked": dynamically_linked,
+            "interpreter": interpreter,
+            "android_api": android_api,
+            "builder": builder,
+            "build_id_sha1": build_id_sha1,
+            "debug_info": elf.get_section_by_name(".debug_info") is not None,
+            "stripped": elf.get_section_by_name(".symtab") is None,
+        }
+
+    @staticmethod
+    def _parse_android_ident(note):
+        """Decode a .note.android.ident descriptor: API level, then
+        optional 64-byte NDK version and 64-byte NDK build number"""
+        desc = note["n_desc"]
+        if isinstance(desc, str):
+            desc = desc.encode("latin-1")
+        if len(desc) < 4:
+            return "none", "unknown"
+        api_level = int.from_bytes(desc[:4], "little")
+        android_api = f"Android {api_level}"
+        builder = "unknown"
+        if len(desc) >= 4 + 64:
+            ndk_version = (
+                desc[4:68].split(b"\x00", 1)[0].decode(errors="replace")
+            )
+            if ndk_version:
+                builder = f"NDK {ndk_version}"
+                if len(desc) >= 4 + 128:
+                    ndk_build = (
+                        desc[68:132].split(b"\x00", 1)[0].decode(errors="replace")
+                    )
+                    if ndk_build:
+                        builder = f"NDK {ndk_version} ({ndk_build})"
+        return android_api, builder
 
     def get_file_info(self):
         """Get basic file information"""
@@ -155,6 +479,23 @@ class BinaryInspector:
 
     def get_symbols(self, pattern):
         """Get symbols matching a pattern"""
+        compiled = re.compile(pattern, re.IGNORECASE)
+        if ELFFile is not None:
+            try:
+                with open(self.binary_path, "rb") as f:
+                    elf = ELFFile(f)
+                    symbols = []
+                    for section_name in (".dynsym", ".symtab"):
+                        section = elf.get_section_by_name(section_name)
+                        if section is None:
+                            continue
+                        for symbol in section.iter_symbols():
+                            if symbol.name and compiled.search(symbol.name):
+                                symbols.append(symbol.name)
+                    return symbols
+            except Exception:
+                pass
+        # Fallback: nm subprocess
         try:
             result = subprocess.run(
                 ["nm", str(self.binary_path)],
@@ -166,64 +507,194 @@ class BinaryInspector:
                 return []
 
             symbols = []
-            for line in result.stdout.split("\n"):
-                if re.search(pattern, line, re.IGNORECASE):
+            for line in result.stdout.splitlines():
+                if compiled.search(line):
                     symbols.append(line.strip())
             return symbols
         except Exception as e:
             return []
 
-    def disassemble(self):
-        """Disassemble the binary"""
+    def _objdump_extra_flags(self):
+        """Probe llvm-objdump once for supported output-trimming flags
+
+        The flags in OBJDUMP_TRIM_FLAGS are relatively new, so gate on
+        the --help text rather than failing on older versions.
+        """
+        if self._extra_flags is None:
+            try:
+                result = subprocess.run(
+                    [str(self.llvm_objdump), "--help"],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                help_text = result.stdout
+            except Exception:
+                help_text = ""
+            self._extra_flags = [
+                flag for probe, flag in OBJDUMP_TRIM_FLAGS if probe in help_text
+            ]
+        return self._extra_flags
+
+    def _bare_lines(self):
+        """Whether disassembly lines will carry no address prefix"""
+        return "--no-leading-addr" in self._objdump_extra_flags()
+
+    def _objdump_proc(self):
+        """Start llvm-objdump on the binary and return the Popen handle"""
+        argv = [str(self.llvm_objdump), "-d"]
+        argv += self._objdump_extra_flags()
+        argv.append(str(self.binary_path))
+        return subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20,
+            text=True,
+        )
+
+    def iter_disasm_lines(self):
+        """Disassemble the binary, yielding output lines as they arrive
+
+        Streaming the llvm-objdump pipe avoids holding the whole (often
+        multi-hundred-MB) disassembly in memory and overlaps objdump
+        decoding with the Python-side scan.
+        """
+        proc = self._objdump_proc()
         try:
-            result = subprocess.run(
-                [str(self.llvm_objdump), "-d", str(self.binary_path)],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout
-        except subprocess.CalledProcessError as e:
-            return ""
-
-    def count_instructions(self, disasm, pattern):
-        """Count instructions matching a pattern in disassembly"""
-        count = 0
-        for line in disasm.split("\n"):
-            if re.search(r"^\s+[0-9a-f]+:", line):
-                if re.search(pattern, line):
-                    count += 1
-        return count
-
-    def find_sample_instructions(self, disasm, pattern, limit=5):
-        """Find sample instructions matching a pattern"""
-        samples = []
-        for line in disasm.split("\n"):
-            if re.search(r"^\s+[0-9a-f]+:", line):
-                if re.search(pattern, line):
-                    samples.append(line.strip())
-                    if len(samples) >= limit:
-                        break
-        return samples
+            yield from proc.stdout
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
+    def iter_disasm_chunks(self, chunk_size=SCAN_CHUNK_SIZE):
+        """Disassemble the binary, yielding newline-aligned text chunks"""
+        proc = self._objdump_proc()
+        try:
+            tail = ""
+            while True:
+                block = proc.stdout.read(chunk_size)
+                if not block:
+                    break
+                block = tail + block
+                cut = block.rfind("\n") + 1
+                if cut:
+                    yield block[:cut]
+                    tail = block[cut:]
+                else:
+                    tail = block
+            if tail:
+                yield tail
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
+    def scan(self, sample_limit=SAMPLE_LIMIT):
+        """Scan the disassembly, in parallel for large binaries"""
+        large = self.binary_path.stat().st_size >= PARALLEL_MIN_SIZE
+        if large and (os.cpu_count() or 1) > 1:
+            return self._scan_parallel(sample_limit)
+        return scan_disasm_lines(
+            self.iter_disasm_lines(), sample_limit, self._bare_lines()
+        )
+
+    def _scan_parallel(self, sample_limit=SAMPLE_LIMIT):
+        """Scan disassembly chunks across one worker process per core
+
+        The regex/automaton scan is CPU-bound and embarrassingly parallel
+        over newline-aligned chunks; per-chunk results reduce to a single
+        (total, Counter, samples) triple.
+        """
+        total_insn = 0
+        counts = Counter()
+        samples = {}
+
+        def merge(future):
+            nonlocal total_insn
+            part_total, part_counts, part_samples = future.result()
+            total_insn += part_total
+            counts.update(part_counts)
+            merge_samples(samples, part_samples, sample_limit)
+
+        max_workers = os.cpu_count()
+        bare = self._bare_lines()
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as pool:
+            # Merge strictly in submission order (FIFO) so the collected
+            # samples are the first occurrences in file order and the
+            # output is deterministic run-to-run; counts would reduce the
+            # same either way, samples would not
+            pending = deque()
+            for chunk in self.iter_disasm_chunks():
+                pending.append(
+                    pool.submit(scan_disasm_chunk, chunk, sample_limit, bare)
+                )
+                # Bound the in-flight chunks so peak memory stays at a few
+                # chunks per worker rather than the whole disassembly
+                if len(pending) >= 2 * max_workers:
+                    merge(pending.popleft())
+            while pending:
+                merge(pending.popleft())
+        return total_insn, counts, samples
 
     def get_build_id(self):
         """Extract build ID from binary"""
-        try:
-            result = subprocess.run(
-                ["readelf", "-n", str(self.binary_path)],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            for line in result.stdout.split("\n"):
-                if "Build ID" in line or "BuildID" in line:
-                    return line.strip()
-            return None
-        except Exception:
+        elf_info = self.get_elf_info()
+        if elf_info is not None:
+            if elf_info["build_id_sha1"] != "none":
+                return f"Build ID: {elf_info['build_id_sha1']}"
             return None
+        # Fallback: one cached readelf invocation
+        for line in self._run_readelf_hn().splitlines():
+            if "Build ID" in line or "BuildID" in line:
+                return line.strip()
+        return None
+
+    def _run_readelf_hn(self):
+        """Run readelf -hn once and cache the output (fallback path)
+
+        The ELF header and notes come from a single invocation so
+        repeated fallback lookups do not fork again. All subprocess
+        calls in this file avoid preexec_fn/shell/stdio tricks so
+        CPython can use its posix_spawn fast path instead of forking
+        the whole Python heap.
+        """
+        if self._readelf_hn is None:
+            try:
+                result = subprocess.run(
+                    ["readelf", "-hn", str(self.binary_path)],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                self._readelf_hn = result.stdout
+            except Exception:
+                self._readelf_hn = ""
+        return self._readelf_hn
 
     def get_embedded_strings(self, pattern):
         """Get embedded strings matching a pattern"""
+        compiled = re.compile(pattern, re.IGNORECASE)
+        if ELFFile is not None:
+            try:
+                with open(self.binary_path, "rb") as f:
+                    elf = ELFFile(f)
+                    section = elf.get_section_by_name(".rodata")
+                    if section is not None:
+                        matches = []
+                        for m in re.finditer(
+                            rb"[\x20-\x7e]{4,}", section.data()
+                        ):
+                            text = m.group().decode("ascii")
+                            if compiled.search(text):
+                                matches.append(text)
+                                if len(matches) >= 10:  # Limit to 10 results
+                                    break
+                        return matches
+            except Exception:
+                pass
+        # Fallback: strings subprocess
         try:
             result = subprocess.run(
                 ["strings", str(self.binary_path)],
@@ -232,8 +703,8 @@ class BinaryInspector:
                 check=True,
             )
             matches = []
-            for line in result.stdout.split("\n"):
-                if re.search(pattern, line, re.IGNORECASE):
+            for line in result.stdout.splitlines():
+                if compiled.search(line):
                     matches.append(line.strip())
             return matches[:10]  # Limit to 10 results
         except Exception:
@@ -246,38 +717,38 @@ class BinaryInspector:
             file_info = file_info.split(":", 1)[1].strip()
 
         # Parse binary format
-        binary_format_match = re.match(r"(ELF [^,]+)", file_info)
+        binary_format_match = _BINARY_FORMAT_RE.match(file_info)
         binary_format = (
             binary_format_match.group(1) if binary_format_match else "unknown"
         )
 
         # Parse architecture
-        arch_match = re.search(r"(ARM aarch64|x86-64|i386|MIPS)", file_info)
+        arch_match = _ARCH_RE.search(file_info)
         arch = arch_match.group(1) if arch_match else "unknown"
 
         # Parse ELF version
-        version_match = re.search(r"(version \d+ \([^)]+\))", file_info)
+        version_match = _ELF_VERSION_RE.search(file_info)
         elf_version = version_match.group(1) if version_match else "unknown"
 
         # Check if dynamically linked
         dynamically_linked = "dynamically linked" in file_info
 
         # Parse interpreter
-        interpreter_match = re.search(r"interpreter ([^,]+)", file_info)
+        interpreter_match = _INTERPRETER_RE.search(file_info)
         interpreter = (
             interpreter_match.group(1).strip() if interpreter_match else "none"
         )
 
         # Parse Android API level
-        android_match = re.search(r"for (Android \d+)", file_info)
+        android_match = _ANDROID_API_RE.search(file_info)
         android_api = android_match.group(1) if android_match else "none"
 
         # Parse builder (NDK)
-        builder_match = re.search(r"built by (NDK [^,]+)", file_info)
+        builder_match = _BUILDER_RE.search(file_info)
         builder = builder_match.group(1) if builder_match else "unknown"
 
         # Parse BuildID
-        buildid_match = re.search(r"BuildID\[sha1\]=([0-9a-f]+)", file_info)
+        buildid_match = _BUILDID_RE.search(file_info)
         build_id_sha1 = buildid_match.group(1) if buildid_match else "none"
 
         # Check for debug info
@@ -299,43 +770,81 @@ class BinaryInspector:
             "stripped": stripped,
         }
 
+    def _cache_path(self):
+        """Cache file for this binary, keyed on size/mtime/inode"""
+        st = self.binary_path.stat()
+        return CACHE_DIR / f"{st.st_size}-{st.st_mtime_ns}-{st.st_ino}.pkl.gz"
+
+    def _load_cached_results(self):
+        """Return previously cached inspect() results, or None"""
+        try:
+            with gzip.open(self._cache_path(), "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def _store_cached_results(self, output):
+        """Atomically cache inspect() results for later runs"""
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path = self._cache_path()
+            tmp_path = cache_path.with_suffix(f".tmp{os.getpid()}")
+            with gzip.open(tmp_path, "wb") as f:
+                pickle.dump(output, f)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+
     def inspect(self):
         """Run full inspection and return ordered dictionary of results"""
-        # Get basic info
-        file_info = self.get_file_info()
-        parsed_info = self.parse_file_info(file_info)
+        # An unchanged binary produces identical results, so a cache hit
+        # bypasses the disassembly entirely
+        cached = self._load_cached_results()
+        if cached is not None:
+            return cached
+
+        # Get basic info: prefer the single in-process ELF pass, fall back
+        # to the file(1) subprocess when pyelftools is unavailable
+        parsed_info = self.get_elf_info()
+        if parsed_info is None:
+            parsed_info = self.parse_file_info(self.get_file_info())
 
         # Get file size in MB
         size_bytes = self.binary_path.stat().st_size
         size_mb = size_bytes / (1024 * 1024)
 
-        # Disassemble and count instructions
-        disasm = self.disassemble()
-        total_insn = self.count_instructions(disasm, r".")
+        # Disassemble and count instructions in a single streaming pass:
+        # one address check per line, then one combined-regex scan covering
+        # all patterns; sample instructions are collected along the way
+        total_insn, counts, self.samples = self.scan()
 
-        # Count instructions for each extension using INSPECT_ARRAY
-        detected = []
-        undetected = []
-        extension_results = OrderedDict()
+        # Report counts for each extension using INSPECT_ARRAY
+        extension_results = {}
 
-        for ext_name, pattern in INSPECT_ARRAY.items():
-            count = self.count_instructions(disasm, pattern)
+        for ext_name in INSPECT_ARRAY:
+            count = counts[ext_name]
             percentage = (count * 100.0) / total_insn if total_insn > 0 else 0.0
 
             extension_results[f"{ext_name}_instructions"] = count
             extension_results[f"{ext_name}_instructions_percentage"] = percentage
+            # Samples come from the same scan pass, no extra traversal
+            ext_samples = self.samples.get(ext_name)
+            extension_results[f"{ext_name}_sample_instructions"] = (
+                " | ".join(ext_samples) if ext_samples else "none"
+            )
 
-            # Build detected/undetected lists
-            if count > 0:
-                detected.append(ext_name)
-            else:
-                undetected.append(ext_name)
+        # Build detected/undetected lists from the final counts, keeping
+        # INSPECT_ARRAY order
+        detected = [ext_name for ext_name in INSPECT_ARRAY if counts[ext_name]]
+        undetected = [
+            ext_name for ext_name in INSPECT_ARRAY if not counts[ext_name]
+        ]
 
         detected_extensions = ";".join(detected) if detected else "none"
         undetected_extensions = ";".join(undetected) if undetected else "none"
 
         # Build final ordered dictionary
-        output = OrderedDict()
+        output = {}
         output["binary_name"] = self.binary_path.name
         output["detected_extensions"] = detected_extensions
         output["undetected_extensions"] = undetected_extensions
@@ -355,6 +864,7 @@ class BinaryInspector:
         # Add extension results
         output.update(extension_results)
 
+        self._store_cached_results(output)
         return output
 
 
@@ -21,6 +21,13 @@ import platform
 import struct
 import sys
 
+# Optional: numpy vectorizes the auxv pair parsing; the struct loop below
+# is the fallback when it is not installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 SUPPORTED_ARCH_LIST = ("aarch64", "x86_64", "i386", "i686")
 
@@ -149,40 +156,64 @@ X86_HWCAP = {
 }
 
 
-def read_string_from_maps(pid, addr, maxlen=4096):
+# Reusable read buffer for read_string_from_maps, so the hot path of
+# repeated lookups allocates nothing per call
+_STR_BUF = bytearray(4096)
+
+
+def read_string_from_maps(mem_fd, addr, maxlen=4096):
     """
-    Best-effort read of a NUL-terminated string at user address 'addr' by
-    reading from /proc/<pid>/mem. Requires permission; may fail.
+    Best-effort read of a NUL-terminated string at user address 'addr'
+    from an already-open /proc/<pid>/mem fd; os.preadv fills the reusable
+    buffer in one syscall at the given offset. Requires permission; may
+    fail.
     """
-    mem_path = f"/proc/{pid}/mem"
     try:
-        with open(mem_path, "rb", buffering=0) as mem:
-            mem.seek(addr)
-            data = mem.read(maxlen)
-            end = data.find(b"\x00")
-            if end != -1:
-                return data[:end].decode(errors="replace")
+        view = memoryview(_STR_BUF)[: min(maxlen, len(_STR_BUF))]
+        n = os.preadv(mem_fd, (view,), addr)
+        end = _STR_BUF.find(b"\x00", 0, n)
+        if end != -1:
+            return bytes(view[:end]).decode(errors="replace")
     except Exception:
         pass
     return None
 
 
-def bits_to_names(bits, table):
-    return [name for bit, name in table.items() if (bits >> bit) & 1]
+def _make_bit_lut(table):
+    """Precompute a bit-index -> name list so decoding touches only set bits"""
+    return [table.get(i) for i in range(64)]
+
+
+AARCH64_HWCAP_LUT = _make_bit_lut(AARCH64_HWCAP)
+AARCH64_HWCAP2_LUT = _make_bit_lut(AARCH64_HWCAP2)
+X86_HWCAP_LUT = _make_bit_lut(X86_HWCAP)
+
+
+def bits_to_names(bits, lut):
+    # Walk only the set bits (O(popcount)) instead of scanning the table
+    names = []
+    while bits:
+        lsb = bits & -bits
+        i = lsb.bit_length() - 1
+        name = lut[i] if i < len(lut) else None
+        if name:
+            names.append(name)
+        bits ^= lsb
+    return names
 
 
 def decode_hwcap(arch, hwcap, hwcap2):
     lines = []
 
     if arch == "aarch64":
-        names1 = bits_to_names(hwcap, AARCH64_HWCAP)
-        names2 = bits_to_names(hwcap2, AARCH64_HWCAP2)
+        names1 = bits_to_names(hwcap, AARCH64_HWCAP_LUT)
+        names2 = bits_to_names(hwcap2, AARCH64_HWCAP2_LUT)
         if names1:
             lines.append("HWCAP:  " + ", ".join(sorted(names1)))
         if names2:
             lines.append("HWCAP2: " + ", ".join(sorted(names2)))
     elif arch in ("x86_64", "i386", "i686"):
-        names = [name for bit, name in X86_HWCAP.items() if (hwcap >> bit) & 1]
+        names = bits_to_names(hwcap, X86_HWCAP_LUT)
         if names:
             lines.append("HWCAP:  " + ", ".join(sorted(names)))
         if hwcap2:
@@ -228,6 +259,17 @@ def parse_auxv(path_or_data, arch=None):
     else:
         raise RuntimeError("Unsupported word size: %d" % ul_size)
 
+    if np is not None and len(data) >= step:
+        # Vectorized path: reinterpret the blob as (type, value) pairs
+        # and cut at the first AT_NULL with one SIMD-backed compare
+        dtype = np.uint64 if ul_size == 8 else np.uint32
+        count = len(data) // step
+        pairs = np.frombuffer(data, dtype=dtype, count=count * 2)
+        pairs = pairs.reshape(-1, 2)
+        nulls = np.flatnonzero(pairs[:, 0] == 0)
+        end = int(nulls[0]) if nulls.size else count
+        return list(zip(pairs[:end, 0].tolist(), pairs[:end, 1].tolist()))
+
     entries = []
     for i in range(0, len(data), step):
         chunk = data[i : i + step]
@@ -307,11 +349,18 @@ Examples:
         str_cache = {}
         if args.try_strings:
             ptr_tags = {16, 24, 31}  # AT_PLATFORM, AT_BASE_PLATFORM, AT_EXECFN
-            for t, v in entries:
-                if t in ptr_tags and v:
-                    s = read_string_from_maps(pid, v)
-                    if s:
-                        str_cache[t] = s
+            # Open /proc/<pid>/mem once and reuse the fd for every lookup
+            try:
+                mem = open(f"/proc/{pid}/mem", "rb", buffering=0)
+            except OSError:
+                mem = None
+            if mem is not None:
+                with mem:
+                    for t, v in entries:
+                        if t in ptr_tags and v:
+                            s = read_string_from_maps(mem.fileno(), v)
+                            if s:
+                                str_cache[t] = s
 
     # Print table
     if entries: